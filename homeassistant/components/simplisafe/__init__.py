@@ -116,6 +116,7 @@ ATTR_TIMESTAMP = "timestamp"
 DEFAULT_CONFIG_URL = "https://webapp.simplisafe.com/new/#/dashboard"
 DEFAULT_ENTITY_MODEL = "Alarm control panel"
 DEFAULT_ERROR_THRESHOLD = 2
+DEFAULT_MAX_CONCURRENT_IMAGE_FETCHES = 2
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 DEFAULT_SOCKET_MIN_RETRY = 15
 
@@ -485,9 +486,11 @@ class SimpliSafe:
         self._system_notifications: dict[int, set[SystemNotification]] = {}
         self._websocket_reconnect_task: asyncio.Task | None = None
         self.entry = entry
+        self.image_semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_IMAGE_FETCHES)
         self.initial_event_to_use: dict[int, dict[str, Any]] = {}
         self.subscription_data: dict[int, Any] = api.subscription_data
         self.systems: dict[int, SystemType] = {}
+        self.v3_systems: list[SystemV3] = []
 
         # This will get filled in by async_init:
         self.coordinator: DataUpdateCoordinator[None] | None = None
@@ -620,6 +623,12 @@ class SimpliSafe:
         for system in self.systems.values():
             self._system_notifications[system.system_id] = set()
 
+            # Device-level platforms (sensors, cameras, locks) only support V3 systems:
+            if isinstance(system, SystemV3):
+                self.v3_systems.append(system)
+            else:
+                LOGGER.info("Skipping device setup for V2 system: %s", system.system_id)
+
             _async_register_base_station(self._hass, self.entry, system)
 
             # Future events will come from the websocket, but since subscription to the
@@ -1,15 +1,25 @@
 """Support for SimpliSafe binary sensors."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import chain
+
 from simplipy.device import DeviceTypes
 from simplipy.device.camera import Camera, CameraTypes
 from simplipy.device.sensor.v3 import SensorV3
 from simplipy.system.v3 import SystemV3
-from simplipy.websocket import EVENT_DOORBELL_DETECTED, EVENT_CAMERA_MOTION_DETECTED
+from simplipy.websocket import (
+    EVENT_CAMERA_MOTION_DETECTED,
+    EVENT_DOORBELL_DETECTED,
+    WebsocketEvent,
+)
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
@@ -17,20 +27,22 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import SimpliSafe, SimpliSafeEntity
-from .const import DOMAIN, LOGGER
-
-SUPPORTED_BATTERY_SENSOR_TYPES = [
-    DeviceTypes.CARBON_MONOXIDE,
-    DeviceTypes.ENTRY,
-    DeviceTypes.GLASS_BREAK,
-    DeviceTypes.KEYPAD,
-    DeviceTypes.LEAK,
-    DeviceTypes.LOCK_KEYPAD,
-    DeviceTypes.MOTION,
-    DeviceTypes.SIREN,
-    DeviceTypes.SMOKE,
-    DeviceTypes.TEMPERATURE,
-]
+from .const import DOMAIN, LOGGER, MOTION_SENSOR_TRIGGER_CLEAR
+
+SUPPORTED_BATTERY_SENSOR_TYPES = frozenset(
+    {
+        DeviceTypes.CARBON_MONOXIDE,
+        DeviceTypes.ENTRY,
+        DeviceTypes.GLASS_BREAK,
+        DeviceTypes.KEYPAD,
+        DeviceTypes.LEAK,
+        DeviceTypes.LOCK_KEYPAD,
+        DeviceTypes.MOTION,
+        DeviceTypes.SIREN,
+        DeviceTypes.SMOKE,
+        DeviceTypes.TEMPERATURE,
+    }
+)
 
 TRIGGERED_SENSOR_TYPES = {
     DeviceTypes.CARBON_MONOXIDE: BinarySensorDeviceClass.GAS,
@@ -43,36 +55,73 @@ TRIGGERED_SENSOR_TYPES = {
 }
 
 
+@dataclass
+class CameraEventRequiredKeysMixin:
+    """Mixin for required keys."""
+
+    event: str
+
+
+@dataclass
+class CameraEventBinarySensorEntityDescription(
+    BinarySensorEntityDescription, CameraEventRequiredKeysMixin
+):
+    """Describe a SimpliSafe binary sensor driven by a camera websocket event."""
+
+
+CAMERA_EVENT_DESCRIPTIONS: tuple[CameraEventBinarySensorEntityDescription, ...] = (
+    CameraEventBinarySensorEntityDescription(
+        key="motion",
+        name="Motion",
+        device_class=BinarySensorDeviceClass.MOTION,
+        event=EVENT_CAMERA_MOTION_DETECTED,
+    ),
+)
+
+# Additional event sensors created for doorbell cameras:
+DOORBELL_EVENT_DESCRIPTIONS: tuple[CameraEventBinarySensorEntityDescription, ...] = (
+    CameraEventBinarySensorEntityDescription(
+        key="doorbell",
+        name="Doorbell",
+        device_class=BinarySensorDeviceClass.OCCUPANCY,
+        event=EVENT_DOORBELL_DETECTED,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up SimpliSafe binary sensors based on a config entry."""
     simplisafe = hass.data[DOMAIN][entry.entry_id]
 
-    sensors: list[BatteryBinarySensor | TriggeredBinarySensor] = []
-
-    for system in simplisafe.systems.values():
-        if system.version == 2:
-            LOGGER.info("Skipping sensor setup for V2 system: %s", system.system_id)
-            continue
+    sensors: list[
+        BatteryBinarySensor | CameraEventBinarySensor | TriggeredBinarySensor
+    ] = []
+    sensors_append = sensors.append
 
+    for system in simplisafe.v3_systems:
         for sensor in system.sensors.values():
-            if sensor.type in TRIGGERED_SENSOR_TYPES:
-                sensors.append(
-                    TriggeredBinarySensor(
-                        simplisafe,
-                        system,
-                        sensor,
-                        TRIGGERED_SENSOR_TYPES[sensor.type],
-                    )
+            if (device_class := TRIGGERED_SENSOR_TYPES.get(sensor.type)) is not None:
+                sensors_append(
+                    TriggeredBinarySensor(simplisafe, system, sensor, device_class)
                 )
             if sensor.type in SUPPORTED_BATTERY_SENSOR_TYPES:
-                sensors.append(BatteryBinarySensor(simplisafe, system, sensor))
+                sensors_append(BatteryBinarySensor(simplisafe, system, sensor))
 
         for cam in system.cameras.values():
-            sensors.append(CameraMotionBinarySensor(simplisafe, system, cam))
+            descriptions: Iterable[
+                CameraEventBinarySensorEntityDescription
+            ] = CAMERA_EVENT_DESCRIPTIONS
             if cam.camera_type == CameraTypes.DOORBELL:
-                sensors.append(CameraDoorbellBinarySensor(simplisafe, system, cam))
+                descriptions = chain(
+                    CAMERA_EVENT_DESCRIPTIONS, DOORBELL_EVENT_DESCRIPTIONS
+                )
+
+            for description in descriptions:
+                sensors_append(
+                    CameraEventBinarySensor(simplisafe, system, cam, description)
+                )
 
     async_add_entities(sensors)
 
@@ -112,7 +161,7 @@ class BatteryBinarySensor(SimpliSafeEntity, BinarySensorEntity):
         super().__init__(simplisafe, system, device=sensor)
 
         self._attr_name = "Battery"
-        self._attr_unique_id = f"{super().unique_id}-battery"
+        self._attr_unique_id = f"{self._attr_unique_id}-battery"
         self._device: SensorV3
 
     @callback
@@ -120,94 +169,69 @@ class BatteryBinarySensor(SimpliSafeEntity, BinarySensorEntity):
         """Update the entity with the provided REST API data."""
         self._attr_is_on = self._device.low_battery
 
-class CameraDoorbellBinarySensor(SimpliSafeEntity, BinarySensorEntity):
-    """Define a SimpliSafe camera binary sensor entity."""
-    
-    _attr_device_class: BinarySensorDeviceClass.OCCUPANCY
-    _attr_is_on = False
 
-    def __init__(
-        self,
-        simplisafe: SimpliSafe,
-        system: SystemV3,
-        camera: Camera,
-        ) -> None:
-        """Initialize."""
-        super().__init__(
-            simplisafe,
-            system,
-            device=camera,
-            additional_websocket_events=[EVENT_DOORBELL_DETECTED]
-        )
-
-        self._device: Camera
-
-        self._attr_name = "Doorbell"
-        self._attr_unique_id = f"{super().unique_id}-doorbell"
-
-    @callback
-    def async_update_from_rest_api(self):
-        """No updates as camera sensor status cannot be read via API."""
-        return
-
-    @callback
-    def async_update_from_websocket_event(self, event):
-        """Update the entity with the provided websocket event data."""
-        LOGGER.critical(event)
-        self._attr_is_on = True
-
-        @callback
-        def clear_delay_listener(now):
-            """Clear motion sensor after delay."""
-            self._attr_is_on = False
-            self.async_write_ha_state()
-
-        async_call_later(
-            self.hass, MOTION_SENSOR_TRIGGER_CLEAR, clear_delay_listener
-        )
-
-class CameraMotionBinarySensor(SimpliSafeEntity, BinarySensorEntity):
-    """Define a SimpliSafe camera binary sensor entity."""
+class CameraEventBinarySensor(SimpliSafeEntity, BinarySensorEntity):
+    """Define a SimpliSafe binary sensor driven by camera websocket events."""
 
-    _attr_device_class = BinarySensorDeviceClass.MOTION
     _attr_is_on = False
+    entity_description: CameraEventBinarySensorEntityDescription
 
     def __init__(
         self,
         simplisafe: SimpliSafe,
         system: SystemV3,
         camera: Camera,
-        ) -> None:
+        description: CameraEventBinarySensorEntityDescription,
+    ) -> None:
         """Initialize."""
         super().__init__(
             simplisafe,
             system,
             device=camera,
-            additional_websocket_events=[EVENT_CAMERA_MOTION_DETECTED]
+            additional_websocket_events=[description.event],
         )
 
+        self.entity_description = description
+        self._attr_unique_id = f"{self._attr_unique_id}-{description.key}"
+        self._clear_handle: asyncio.TimerHandle | None = None
         self._device: Camera
-
-        self._attr_name = "Motion"
-        self._attr_unique_id = f"{super().unique_id}-motion"
+        # This will get filled in by async_added_to_hass:
+        self._loop_call_later: Callable[..., asyncio.TimerHandle]
 
     @callback
-    def async_update_from_rest_api(self):
+    def async_update_from_rest_api(self) -> None:
         """No updates as camera sensor status cannot be read via API."""
-        return
 
     @callback
-    def async_update_from_websocket_event(self, event):
+    def async_update_from_websocket_event(self, event: WebsocketEvent) -> None:
         """Update the entity with the provided websocket event data."""
-        LOGGER.critical(event)
+        LOGGER.debug("Received camera event: %s", event)
         self._attr_is_on = True
 
-        @callback
-        def clear_delay_listener(now):
-            """Clear motion sensor after delay."""
-            self._attr_is_on = False
-            self.async_write_ha_state()
-
-        async_call_later(
-            self.hass, MOTION_SENSOR_TRIGGER_CLEAR, clear_delay_listener
+        # Debounce: a new event pushes back the pending clear:
+        if self._clear_handle is not None:
+            self._clear_handle.cancel()
+        self._clear_handle = self._loop_call_later(
+            MOTION_SENSOR_TRIGGER_CLEAR, self._clear
         )
+
+    @callback
+    def _clear(self) -> None:
+        """Clear the sensor after a delay."""
+        self._attr_is_on = False
+        self.async_write_ha_state()
+        self._clear_handle = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        # Bind before the base class subscribes to websocket events:
+        self._loop_call_later = self.hass.loop.call_later
+        await super().async_added_to_hass()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending clear when the entity is removed."""
+        await super().async_will_remove_from_hass()
+
+        if self._clear_handle is not None:
+            self._clear_handle.cancel()
+            self._clear_handle = None
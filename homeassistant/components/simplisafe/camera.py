@@ -1,5 +1,6 @@
 """This component provides support for SimpliSafe cameras."""
 import asyncio
+import shlex
 
 from haffmpeg.camera import CameraMjpeg
 from haffmpeg.tools import IMAGE_JPEG, ImageFrame
@@ -16,21 +17,29 @@ from homeassistant.helpers.aiohttp_client import async_aiohttp_proxy_stream
 from . import SimpliSafe, SimpliSafeEntity
 from .const import DOMAIN, LOGGER
 
+# Seconds during which a still image is considered fresh; for the same period after
+# that, the stale image is served while a new one is fetched in the background:
+IMAGE_CACHE_TTL = 2.0
+
+SHUTTER_ATTR_BY_STATE = {
+    SystemStates.AWAY: "shutter_open_when_away",
+    SystemStates.HOME: "shutter_open_when_home",
+    SystemStates.OFF: "shutter_open_when_off",
+}
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up SimpliCam cameras based on a config entry."""
     simplisafe: SimpliSafe = hass.data[DOMAIN][entry.entry_id]
 
+    ffmpeg: FFmpegManager = hass.data[DATA_FFMPEG]
     cameras: list[SimpliSafeCamera] = []
 
-    for system in simplisafe.systems.values():
-        if system.version == 2:
-            LOGGER.info("Skipping sensor setup for V2 system: %s", system.system_id)
-            continue
-
-        for cam in system.cameras.values():
-            cameras.append(SimpliSafeCamera(simplisafe, system, hass.data[DATA_FFMPEG], cam))
-
+    for system in simplisafe.v3_systems:
+        cameras.extend(
+            SimpliSafeCamera(simplisafe, system, ffmpeg, cam)
+            for cam in system.cameras.values()
+        )
 
     async_add_entities(cameras)
 
@@ -38,7 +47,13 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class SimpliSafeCamera(SimpliSafeEntity, Camera):
     """An implementation of a SimpliCam camera."""
 
-    def __init__(self, simplisafe: SimpliSafe, system: SystemV3, ffmpeg: FFmpegManager, camera: SimpliCam):
+    def __init__(
+        self,
+        simplisafe: SimpliSafe,
+        system: SystemV3,
+        ffmpeg: FFmpegManager,
+        camera: SimpliCam,
+    ):
         """Initialize a SimpliCam camera."""
         Camera.__init__(self)
         super().__init__(
@@ -49,85 +64,129 @@ class SimpliSafeCamera(SimpliSafeEntity, Camera):
 
         self._device: SimpliCam
         self._ffmpeg = ffmpeg
-        self._last_image = None
+        self._image_frame = ImageFrame(ffmpeg.binary)
+        self._last_image: bytes | None = None
+        self._last_image_ts = 0.0
+        self._refresh_task: asyncio.Task | None = None
 
         self._attr_name = "Camera"
-        self._attr_unique_id = f"{super().unique_id}-camera"
+        self._attr_unique_id = f"{self._attr_unique_id}-camera"
 
-        self._is_online = self._device.status == "online"
-        self._is_subscribed = self._device.subscription_enabled
-        
+        self._api = simplisafe._api
+        self._cached_video_url: str
 
-    @property
-    def is_on(self):
-        """Return true if on."""
-        return self._is_online and self._is_subscribed
+        self.async_update_from_rest_api()
 
     @callback
-    def async_update_from_rest_api(self):
+    def async_update_from_rest_api(self) -> None:
         """Update the entity with the provided REST API data."""
-        self._is_online = self._device.status == "online"
-        self._is_subscribed = self._device.subscription_enabled
+        is_online = self._device.status == "online"
+        is_subscribed = self._device.subscription_enabled
+        self._attr_is_on = is_online and is_subscribed
+        self._build_video_url()
 
-    @property
-    def _video_url(self):
-        """Provide the image URL."""
-        url = self._device.video_url()
-        return '-re {} -i "{}"'.format(
-            self.auth_headers, url
-        )
+    @callback
+    def _async_handle_refresh_token(self, _: str) -> None:
+        """Rebuild the ffmpeg input when the access token is rotated."""
+        self._build_video_url()
 
-    @property
-    def auth_headers(self):
-        """Generate auth headers."""
-        return '-headers "Authorization: Bearer {}"'.format(
-            self._simplisafe._api.access_token
+    @callback
+    def _build_video_url(self) -> None:
+        """Build (and cache) the ffmpeg input string for the camera."""
+        # haffmpeg shlex-splits a multi-argument input source, so join the arguments
+        # with proper quoting once rather than hand-assembling a quoted string:
+        self._cached_video_url = shlex.join(
+            [
+                "-headers",
+                f"Authorization: Bearer {self._api.access_token}\r\n",
+                "-re",
+                "-i",
+                self._device.video_url(),
+            ]
         )
 
     @property
     def is_shutter_open(self):
         """Check if the camera shutter is open."""
-        if self._system.state == SystemStates.off:
-            return self._device.shutter_open_when_off
-        if self._system.state == SystemStates.home:
-            return self._device.shutter_open_when_home
-        if self._system.state == SystemStates.away:
-            return self._device.shutter_open_when_away
-        return True
+        if (attr := SHUTTER_ATTR_BY_STATE.get(self._system.state)) is None:
+            return True
+        return getattr(self._device, attr)
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            self._api.add_refresh_token_callback(self._async_handle_refresh_token)
+        )
 
     async def stream_source(self) -> str | None:
-        return self._video_url
+        return self._cached_video_url
 
-    async def async_device_image(self):
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
         """Return a still image response from the camera."""
         if not self.is_shutter_open:
-            """Shutter is currently closed, return last image."""
+            # The shutter is currently closed, so return the last image:
             return self._last_image
 
-        ffmpeg = ImageFrame(self._ffmpeg.binary)
+        if self._last_image is not None:
+            age = self.hass.loop.time() - self._last_image_ts
+            if age < IMAGE_CACHE_TTL:
+                return self._last_image
+            if age < 2 * IMAGE_CACHE_TTL:
+                self._async_start_image_refresh()
+                return self._last_image
 
-        if self._video_url is None:
-            return
+        # Concurrent requests share a single in-flight fetch:
+        return await asyncio.shield(self._async_start_image_refresh())
+
+    @callback
+    def _async_start_image_refresh(self) -> asyncio.Task:
+        """Start an image fetch (unless one is already in progress) and return it."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_task(self._async_fetch_image())
+        return self._refresh_task
+
+    async def _async_fetch_image(self) -> bytes | None:
+        """Fetch (and cache) a new still image via ffmpeg."""
+        try:
+            async with self._simplisafe.image_semaphore:
+                image = await self._image_frame.get_image(
+                    self._cached_video_url,
+                    output_format=IMAGE_JPEG,
+                )
+        except Exception as err:  # pylint: disable=broad-except
+            # This may run as an unawaited background refresh, so don't let errors
+            # escape the task:
+            LOGGER.error("Error while fetching camera image: %s", err)
+            return self._last_image
+
+        # Keep serving the last good image if ffmpeg failed or timed out:
+        if image is None:
+            return self._last_image
 
-        image = await asyncio.shield(
-            ffmpeg.get_image(
-                self._video_url,
-                output_format=IMAGE_JPEG,
-            )
-        )
         self._last_image = image
+        self._last_image_ts = self.hass.loop.time()
         return image
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any in-progress image refresh when the entity is removed."""
+        await super().async_will_remove_from_hass()
+
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+
     async def handle_async_mjpeg_stream(self, request):
         """Generate an HTTP MJPEG stream from the camera."""
-        if self._video_url is None:
+        if not self.is_shutter_open:
+            # Don't spawn ffmpeg for a camera whose shutter is closed:
             return
 
-        LOGGER.warn(self._video_url)
-
         stream = CameraMjpeg(self._ffmpeg.binary)
         await stream.open_camera(
-            self._video_url,
+            self._cached_video_url,
         )
 
         try:
@@ -139,4 +198,4 @@ class SimpliSafeCamera(SimpliSafeEntity, Camera):
                 self._ffmpeg.ffmpeg_stream_content_type,
             )
         finally:
-            await stream.close()
\ No newline at end of file
+            await stream.close()
@@ -5,6 +5,9 @@ LOGGER = logging.getLogger(__package__)
 
 DOMAIN = "simplisafe"
 
+# Seconds after which a camera motion/doorbell sensor returns to "off":
+MOTION_SENSOR_TRIGGER_CLEAR = 10
+
 ATTR_ALARM_DURATION = "alarm_duration"
 ATTR_ALARM_VOLUME = "alarm_volume"
 ATTR_CHIME_VOLUME = "chime_volume"
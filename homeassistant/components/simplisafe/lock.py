@@ -35,11 +35,7 @@ async def async_setup_entry(
     simplisafe = hass.data[DOMAIN][entry.entry_id]
     locks = []
 
-    for system in simplisafe.systems.values():
-        if system.version == 2:
-            LOGGER.info("Skipping lock setup for V2 system: %s", system.system_id)
-            continue
-
+    for system in simplisafe.v3_systems:
         for lock in system.locks.values():
             locks.append(SimpliSafeLock(simplisafe, system, lock))
 
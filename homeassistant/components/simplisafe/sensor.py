@@ -16,7 +16,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import SimpliSafe, SimpliSafeEntity
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
 
 
 async def async_setup_entry(
@@ -26,11 +26,7 @@ async def async_setup_entry(
     simplisafe = hass.data[DOMAIN][entry.entry_id]
     sensors = []
 
-    for system in simplisafe.systems.values():
-        if system.version == 2:
-            LOGGER.info("Skipping sensor setup for V2 system: %s", system.system_id)
-            continue
-
+    for system in simplisafe.v3_systems:
         for sensor in system.sensors.values():
             if sensor.type == DeviceTypes.TEMPERATURE:
                 sensors.append(SimplisafeFreezeSensor(simplisafe, system, sensor))
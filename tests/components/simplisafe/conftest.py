@@ -18,6 +18,25 @@ PASSWORD = "password"
 SYSTEM_ID = 12345
 
 
+@pytest.fixture(name="advance_loop_time")
+def advance_loop_time_fixture(hass):
+    """Define a helper to move the event loop's clock forward."""
+    offset = 0.0
+    real_time = hass.loop.time
+
+    def loop_time():
+        """Return the offset loop time."""
+        return real_time() + offset
+
+    def advance_loop_time(seconds):
+        """Advance the loop time by a number of seconds."""
+        nonlocal offset
+        offset += seconds
+
+    with patch.object(hass.loop, "time", loop_time):
+        yield advance_loop_time
+
+
 @pytest.fixture(name="api")
 def api_fixture(data_subscription, system_v3, websocket):
     """Define a simplisafe-python API object."""
@@ -83,6 +102,12 @@ def data_subscription_fixture():
     return {SYSTEM_ID: data}
 
 
+@pytest.fixture(name="platforms")
+def platforms_fixture():
+    """Define the platforms to set up (none by default)."""
+    return []
+
+
 @pytest.fixture(name="reauth_config")
 def reauth_config_fixture():
     """Define a reauth config."""
@@ -92,7 +117,7 @@ def reauth_config_fixture():
 
 
 @pytest.fixture(name="setup_simplisafe")
-async def setup_simplisafe_fixture(hass, api, config):
+async def setup_simplisafe_fixture(hass, api, config, platforms):
     """Define a fixture to set up SimpliSafe."""
     with patch(
         "homeassistant.components.simplisafe.config_flow.API.async_from_auth",
@@ -106,7 +131,7 @@ async def setup_simplisafe_fixture(hass, api, config):
     ), patch(
         "homeassistant.components.simplisafe.SimpliSafe._async_start_websocket_loop"
     ), patch(
-        "homeassistant.components.simplisafe.PLATFORMS", []
+        "homeassistant.components.simplisafe.PLATFORMS", platforms
     ):
         assert await async_setup_component(hass, DOMAIN, config)
         await hass.async_block_till_done()
@@ -0,0 +1,110 @@
+"""Define tests for SimpliSafe binary sensors."""
+import json
+
+import pytest
+from simplipy.websocket import websocket_event_from_payload
+
+from homeassistant.components.simplisafe.const import MOTION_SENSOR_TRIGGER_CLEAR
+from homeassistant.const import STATE_OFF, STATE_ON, Platform
+
+from .conftest import SYSTEM_ID
+
+from tests.common import async_fire_time_changed, load_fixture
+
+CAMERA_SERIAL = "1234567890"
+
+
+@pytest.fixture(name="data_subscription")
+def data_subscription_fixture():
+    """Define subscription data with a doorbell camera."""
+    data = json.loads(load_fixture("subscription_data.json", "simplisafe"))
+    [camera] = data["location"]["system"]["cameras"]
+    camera["model"] = "SS002"
+    camera["cameraSettings"]["cameraName"] = "Doorbell"
+    return {SYSTEM_ID: data}
+
+
+@pytest.fixture(name="platforms")
+def platforms_fixture():
+    """Define the platforms to set up."""
+    return [Platform.BINARY_SENSOR]
+
+
+def _fire_camera_event(websocket, event_cid):
+    """Fire a camera websocket event."""
+    websocket.add_event_callback.call_args[0][0](
+        websocket_event_from_payload(
+            {
+                "data": {
+                    "eventCid": event_cid,
+                    "info": "Camera event",
+                    "sid": SYSTEM_ID,
+                    "eventTimestamp": 1676060421,
+                    "pinName": "",
+                    "sensorName": "Doorbell",
+                    "sensorSerial": CAMERA_SERIAL,
+                    "sensorType": 17,
+                }
+            }
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "entity_id,event_cid",
+    [
+        ("binary_sensor.doorbell_camera_motion", 1170),
+        ("binary_sensor.doorbell_camera_doorbell", 1458),
+    ],
+)
+async def test_camera_event_debounce(
+    hass,
+    advance_loop_time,
+    config_entry,
+    entity_id,
+    event_cid,
+    setup_simplisafe,
+    websocket,
+):
+    """Test that repeated camera events keep the sensor on until they stop."""
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    _fire_camera_event(websocket, event_cid)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    advance_loop_time(MOTION_SENSOR_TRIGGER_CLEAR - 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    # A second event restarts the clear timer:
+    _fire_camera_event(websocket, event_cid)
+    await hass.async_block_till_done()
+    advance_loop_time(MOTION_SENSOR_TRIGGER_CLEAR - 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    advance_loop_time(2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+
+async def test_camera_event_clear_cancelled_on_unload(
+    hass, config_entry, setup_simplisafe, websocket
+):
+    """Test that a pending clear is cancelled when the sensor is removed."""
+    entity_id = "binary_sensor.doorbell_camera_motion"
+    _fire_camera_event(websocket, 1170)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert not [
+        handle
+        for handle in hass.loop._scheduled
+        if not handle.cancelled() and handle._callback.__name__ == "_clear"
+    ]
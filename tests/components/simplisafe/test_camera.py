@@ -0,0 +1,230 @@
+"""Define tests for SimpliSafe cameras."""
+import asyncio
+from copy import deepcopy
+import json
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+from haffmpeg.tools import IMAGE_JPEG, ImageFrame
+import pytest
+from simplipy.system import SystemStates
+from simplipy.system.v3 import SystemV3
+
+from homeassistant.components.camera import async_get_image
+from homeassistant.components.simplisafe import DEFAULT_MAX_CONCURRENT_IMAGE_FETCHES
+from homeassistant.components.simplisafe.camera import IMAGE_CACHE_TTL
+from homeassistant.const import Platform
+from homeassistant.exceptions import HomeAssistantError
+
+from .conftest import SYSTEM_ID
+
+from tests.common import load_fixture
+
+CAMERA_COUNT = DEFAULT_MAX_CONCURRENT_IMAGE_FETCHES + 2
+ENTITY_ID = "camera.camera_0_camera_camera"
+
+IMAGE_NEW = b"new image"
+IMAGE_OLD = b"old image"
+
+
+@pytest.fixture(name="data_subscription")
+def data_subscription_fixture():
+    """Define subscription data with several cameras."""
+    data = json.loads(load_fixture("subscription_data.json", "simplisafe"))
+    [camera] = data["location"]["system"]["cameras"]
+    cameras = []
+    for idx in range(CAMERA_COUNT):
+        camera_data = deepcopy(camera)
+        camera_data["uuid"] = f"{camera['uuid']}{idx}"
+        camera_data["cameraSettings"]["cameraName"] = f"Camera {idx}"
+        cameras.append(camera_data)
+    data["location"]["system"]["cameras"] = cameras
+    return {SYSTEM_ID: data}
+
+
+@pytest.fixture(name="get_image")
+def get_image_fixture():
+    """Define a mocked ffmpeg still-image fetch."""
+    with patch.object(
+        ImageFrame, "get_image", AsyncMock(return_value=IMAGE_OLD)
+    ) as mock_get_image:
+        yield mock_get_image
+
+
+@pytest.fixture(name="platforms")
+def platforms_fixture():
+    """Define the platforms to set up."""
+    return [Platform.CAMERA]
+
+
+def _assert_image_request(input_source, output_format):
+    """Assert that ffmpeg was asked for an authenticated JPEG."""
+    assert "Authorization: Bearer" in input_source
+    assert output_format == IMAGE_JPEG
+
+
+async def _async_get_content(hass, entity_id=ENTITY_ID):
+    """Get the content of a camera's still image."""
+    return (await async_get_image(hass, entity_id)).content
+
+
+@pytest.mark.parametrize(
+    "system_state,fetched",
+    [
+        (SystemStates.AWAY, True),
+        (SystemStates.OFF, False),
+        (SystemStates.UNKNOWN, True),
+    ],
+)
+async def test_image_shutter(
+    hass, config_entry, fetched, get_image, setup_simplisafe, system_state
+):
+    """Test that an image is only fetched while the shutter is open."""
+    with patch.object(
+        SystemV3, "state", new_callable=PropertyMock, return_value=system_state
+    ):
+        if fetched:
+            assert await _async_get_content(hass) == IMAGE_OLD
+        else:
+            with pytest.raises(HomeAssistantError):
+                await async_get_image(hass, ENTITY_ID)
+
+    assert get_image.await_count == int(fetched)
+
+
+async def test_image_fresh(
+    hass, advance_loop_time, config_entry, get_image, setup_simplisafe
+):
+    """Test that a fresh cached image is returned without fetching a new one."""
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+    advance_loop_time(IMAGE_CACHE_TTL / 2)
+    get_image.return_value = IMAGE_NEW
+    assert await _async_get_content(hass) == IMAGE_OLD
+    await hass.async_block_till_done()
+    get_image.assert_awaited_once()
+
+
+async def test_image_stale(
+    hass, advance_loop_time, config_entry, get_image, setup_simplisafe
+):
+    """Test that a stale image is returned while a single refresh runs."""
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+    advance_loop_time(IMAGE_CACHE_TTL * 1.5)
+    get_image.return_value = IMAGE_NEW
+    assert await _async_get_content(hass) == IMAGE_OLD
+    assert await _async_get_content(hass) == IMAGE_OLD
+    await hass.async_block_till_done()
+    assert get_image.await_count == 2
+
+    assert await _async_get_content(hass) == IMAGE_NEW
+
+
+async def test_image_expired(
+    hass, advance_loop_time, config_entry, get_image, setup_simplisafe
+):
+    """Test that an expired image waits for a new fetch."""
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+    advance_loop_time(IMAGE_CACHE_TTL * 3)
+    get_image.return_value = IMAGE_NEW
+    assert await _async_get_content(hass) == IMAGE_NEW
+    assert get_image.await_count == 2
+
+
+async def test_image_fetch_failure(
+    hass, advance_loop_time, config_entry, get_image, setup_simplisafe
+):
+    """Test that a failed fetch keeps the last good image."""
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+    advance_loop_time(IMAGE_CACHE_TTL * 3)
+    get_image.return_value = None
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+    get_image.side_effect = RuntimeError("ffmpeg crashed")
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+
+async def test_image_refresh_cancelled_on_unload(
+    hass, advance_loop_time, config_entry, get_image, setup_simplisafe
+):
+    """Test that an in-progress refresh is cancelled when the camera is removed."""
+    assert await _async_get_content(hass) == IMAGE_OLD
+
+    cancelled = asyncio.Event()
+
+    async def get_image_forever(input_source, output_format):
+        """Block until cancelled."""
+        _assert_image_request(input_source, output_format)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    get_image.side_effect = get_image_forever
+    advance_loop_time(IMAGE_CACHE_TTL * 1.5)
+    assert await _async_get_content(hass) == IMAGE_OLD
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert cancelled.is_set()
+
+
+async def test_image_requests_deduplicated(
+    hass, config_entry, get_image, setup_simplisafe
+):
+    """Test that concurrent requests for one camera share a single fetch."""
+    release = asyncio.Event()
+
+    async def get_image_blocking(input_source, output_format):
+        """Block until released."""
+        _assert_image_request(input_source, output_format)
+        await release.wait()
+        return IMAGE_NEW
+
+    get_image.side_effect = get_image_blocking
+
+    requests = asyncio.gather(*(_async_get_content(hass) for _ in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await requests == [IMAGE_NEW] * 5
+    get_image.assert_awaited_once()
+
+
+async def test_image_fetches_throttled(hass, config_entry, get_image, setup_simplisafe):
+    """Test that concurrent fetches across cameras are capped."""
+    active = 0
+    max_active = 0
+    release = asyncio.Event()
+
+    async def get_image_tracking(input_source, output_format):
+        """Track concurrent fetches and block until released."""
+        nonlocal active, max_active
+        _assert_image_request(input_source, output_format)
+        active += 1
+        max_active = max(max_active, active)
+        await release.wait()
+        active -= 1
+        return IMAGE_NEW
+
+    get_image.side_effect = get_image_tracking
+
+    entity_ids = hass.states.async_entity_ids(Platform.CAMERA)
+    assert len(entity_ids) == CAMERA_COUNT
+
+    requests = asyncio.gather(
+        *(_async_get_content(hass, entity_id) for entity_id in entity_ids)
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert active == DEFAULT_MAX_CONCURRENT_IMAGE_FETCHES
+
+    release.set()
+    assert await requests == [IMAGE_NEW] * CAMERA_COUNT
+    assert max_active == DEFAULT_MAX_CONCURRENT_IMAGE_FETCHES
+    assert get_image.await_count == CAMERA_COUNT